@@ -31,6 +31,8 @@ import os
 import sys
 from typing import IO
 from typing import Any
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Mapping
 from typing import MutableMapping
@@ -71,6 +73,9 @@ AnyBytes: TypeAlias = Union[bytes, bytearray, memoryview]
 AnyPath: TypeAlias = Union[bytes, bytearray, str, os.PathLike]
 EllipsisType: TypeAlias = Type['Ellipsis']
 
+FILE_BUFFER_SIZE: int = 1 << 20
+r"""Buffer size of the files opened by :meth:`BaseFile.load` and :meth:`BaseFile.save`."""
+
 FILE_TYPES: MutableMapping[str, Type['BaseFile']] = {}
 r"""Registered record file types."""
 
@@ -273,9 +278,7 @@ def guess_format_name(file_path: str) -> str:
     file_ext = os.path.splitext(file_path)[1]
     names_found = []
 
-    for name in FILE_TYPES.keys():
-        file_type = FILE_TYPES[name]
-
+    for name, file_type in FILE_TYPES.items():
         if file_ext in file_type.FILE_EXT:
             names_found.append(name)
 
@@ -285,10 +288,16 @@ def guess_format_name(file_path: str) -> str:
     if len(names_found) == 1:
         return names_found[0]
 
+    try:
+        with open(file_path, 'rb') as stream:
+            buffer = stream.read()  # read once, parse many
+    except Exception:
+        raise ValueError('cannot guess record file format')
+
     for name in names_found:
         file_type = FILE_TYPES[name]
         try:
-            with open(file_path, 'rb') as stream:
+            with io.BytesIO(buffer) as stream:
                 file_type.parse(stream)
             return name
         except Exception:
@@ -656,8 +665,24 @@ class BaseRecord(abc.ABC):
 
         validate (bool):
             If true, :meth:`validate` is called upon initialization.
+            Factory methods and record generators pass false once they have
+            already checked every field to be in range, skipping the redundant
+            checks.
     """
 
+    __slots__ = (
+        '__dict__',  # extra attributes, materialized only when assigned
+        '__weakref__',  # weak references, as for plain objects
+        'address',
+        'after',
+        'before',
+        'checksum',
+        'coords',
+        'count',
+        'data',
+        'tag',
+    )
+
     EQUALITY_KEYS: Sequence[str] = [
         'address',
         'checksum',
@@ -794,6 +819,13 @@ class BaseRecord(abc.ABC):
         if validate:
             _count = count is not None
             _checksum = checksum is not None and _count
+
+            # Freshly computed values are consistent by construction
+            if count is Ellipsis and self.count is not None:
+                _count = False
+            if checksum is Ellipsis and self.checksum is not None:
+                _checksum = False
+
             self.validate(checksum=_checksum, count=_count)
 
     def __ne__(self, other: 'BaseRecord') -> bool:
@@ -866,9 +898,8 @@ class BaseRecord(abc.ABC):
         """
 
         meta = self.get_meta()
-        text = f'<{self.__class__!s} @0x{id(self):08X} '
-        text += ' '.join(f'{key!s}:={value!r}' for key, value in meta.items())
-        text += '>'
+        items = ' '.join([f'{key!s}:={value!r}' for key, value in meta.items()])
+        text = f'<{self.__class__!s} @0x{id(self):08X} {items}>'
         return text
 
     def __str__(self) -> str:
@@ -1375,24 +1406,27 @@ class BaseRecord(abc.ABC):
         if self.address < 0:
             raise ValueError('address overflow')
 
-        if self.checksum is not None:
-            if self.checksum < 0:
+        record_checksum = self.checksum
+        if record_checksum is not None:
+            if record_checksum < 0:
                 raise ValueError('checksum overflow')
 
             if checksum:
-                if self.checksum != self.compute_checksum():
+                if record_checksum != self.compute_checksum():
                     raise ValueError('wrong checksum')
 
-        if self.count is not None:
-            if self.count < 0:
+        record_count = self.count
+        if record_count is not None:
+            if record_count < 0:
                 raise ValueError('count overflow')
 
             if count:
-                if self.count != self.compute_count():
+                if record_count != self.compute_count():
                     raise ValueError('wrong count')
 
         TagType = _cast(Any, self.Tag)
-        TagType(self.tag)
+        if self.tag.__class__ is not TagType:
+            TagType(self.tag)
 
         return self
 
@@ -1974,6 +2008,54 @@ class BaseFile(abc.ABC):
 
         return not line or line.isspace()
 
+    @classmethod
+    def _merge_data_blocks(
+        cls,
+        chunks: Iterable[Tuple[int, AnyBytes]],
+    ) -> Iterator[Tuple[int, bytearray]]:
+        r"""Merges adjacent data chunks into blocks.
+
+        Consecutive chunks where each one starts right at the end of the
+        previous one are concatenated into a single block.
+        Blocks are yielded in order, so that writing them onto a memory
+        object gives the same result as writing each chunk.
+        It may be used internally to apply many small *data* records with few
+        memory writes, e.g. by :meth:`apply_records`.
+
+        Args:
+            chunks (list of (int, bytes)):
+                Sequence of ``(address, data)`` chunks.
+
+        Yields:
+            (int, bytearray): Merged ``(address, data)`` block.
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseFile`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> from hexrec import IhexFile
+            >>> chunks = [(0, b'ab'), (2, b'cd'), (8, b'xy'), (4, b'ef')]
+            >>> list(IhexFile._merge_data_blocks(chunks))
+            [(0, bytearray(b'abcd')), (8, bytearray(b'xy')), (4, bytearray(b'ef'))]
+        """
+
+        block_address = 0
+        block_data = None
+        block_endex = 0
+
+        for address, data in chunks:
+            if block_data is not None and address == block_endex:
+                block_data += data
+            else:
+                if block_data is not None:
+                    yield block_address, block_data
+                block_address = address
+                block_data = bytearray(data)
+            block_endex = address + len(data)
+
+        if block_data is not None:
+            yield block_address, block_data
+
     def align(
         self,
         modulo: int,
@@ -2107,10 +2189,13 @@ class BaseFile(abc.ABC):
             raise ValueError('records required')
 
         memory = Memory()
+        tag_is_data = self.Record.Tag.is_data
+        chunks = [(record.address, record.data)
+                  for record in self._records
+                  if tag_is_data(record.tag)]
 
-        for record in self._records:
-            if record.tag.is_data():
-                memory.write(record.address, record.data)
+        for address, block_data in self._merge_data_blocks(chunks):
+            memory.write(address, block_data)
 
         self.discard_memory()
         self._memory = memory
@@ -3068,6 +3153,45 @@ class BaseFile(abc.ABC):
         offset = self.memory.index(item, start=start, endex=endex)
         return offset
 
+    def iter_lines(self, *args, **kwargs) -> Iterator[bytes]:
+        r"""Iterates serialized lines.
+
+        By default, it yields the :meth:`BaseRecord.to_bytestr` output of each
+        of the :attr:`records`, generating them if needed.
+        Some *formats* override it to build lines straight from :attr:`memory`,
+        leaving :attr:`records` untouched.
+
+        Args:
+            args:
+                Forwarded to :meth:`BaseRecord.to_bytestr` of each record.
+
+            kwargs:
+                Forwarded to :meth:`BaseRecord.to_bytestr` of each record.
+
+        Yields:
+            bytes: Serialized line.
+
+        See Also:
+            :attr:`records`
+            :meth:`serialize`
+            :meth:`BaseRecord.to_bytestr`
+
+        Examples:
+            **NOTE:** These examples are provided by :class:`BaseFile`.
+            Inherited classes for specific *formats* may require an adaptation.
+
+            >>> from hexrec import IhexFile
+            >>> file = IhexFile.from_blocks([[0xDA7A, b'abc']], startaddr=0xCAFE)
+            >>> for line in file.iter_lines(end=b''):
+            ...     print(line.decode())
+            :03DA7A0061626383
+            :040000050000CAFE2F
+            :00000001FF
+        """
+
+        for record in self.records:
+            yield record.to_bytestr(*args, **kwargs)
+
     @classmethod
     def load(cls, path: Optional[AnyPath], *args, **kwargs) -> Self:
         r"""Loads a file object from the filesystem.
@@ -3110,7 +3234,7 @@ class BaseFile(abc.ABC):
         if path is None:
             return cls.parse(sys.stdin.buffer, *args, **kwargs)
         else:
-            with open(path, 'rb') as stream:
+            with open(path, 'rb', buffering=FILE_BUFFER_SIZE) as stream:
                 return cls.parse(stream, *args, **kwargs)
 
     @property
@@ -3332,6 +3456,10 @@ class BaseFile(abc.ABC):
         Record = cls.Record
         records = []
         row = 0
+        maxdatalen = 0
+        Tag = Record.Tag
+        tag_is_data = Tag.is_data
+        tag_is_file_termination = Tag.is_file_termination
 
         for line in stream:
             row += 1
@@ -3348,12 +3476,21 @@ class BaseFile(abc.ABC):
 
             record.coords = (row, 0)
             records.append(record)
+            tag = record.tag
+
+            if tag_is_data(tag):
+                size = len(record.data)
+                if maxdatalen < size:
+                    maxdatalen = size
 
             if ignore_after_termination:
-                if record.tag.is_file_termination():
+                if tag_is_file_termination(tag):
                     break
 
-        file = cls.from_records(records)
+        if maxdatalen < 1:
+            maxdatalen = cls.DEFAULT_DATALEN
+
+        file = cls.from_records(records, maxdatalen=maxdatalen)
         return file
 
     def print(
@@ -3574,7 +3711,7 @@ class BaseFile(abc.ABC):
         if path is None:
             return self.serialize(sys.stdout.buffer, *args, **kwargs)
         else:
-            with open(path, 'wb') as stream:
+            with open(path, 'wb', buffering=FILE_BUFFER_SIZE) as stream:
                 return self.serialize(stream, *args, **kwargs)
 
     def set_meta(
@@ -3629,24 +3766,31 @@ class BaseFile(abc.ABC):
     def serialize(self, stream: IO, *args, **kwargs) -> Self:
         r"""Serializes records onto a byte stream.
 
-        It executes :meth:`BaseRecord.serialize` for each of the stored
-        :attr:`records`.
+        It joins the :meth:`BaseRecord.to_bytestr` output of each of the stored
+        :attr:`records`, writing it with a single ``stream.write`` call.
+
+        If :attr:`records` are not populated yet, the lines are generated by
+        :meth:`iter_lines` instead, which some *formats* build straight from
+        :attr:`memory`.
 
         Args:
             stream (bytes IO):
                 Stream to serialize records onto.
 
             args:
-                Forwarded to :meth:`BaseRecord.serialize` of each record.
+                Forwarded to :meth:`BaseRecord.to_bytestr` of each record, or
+                to :meth:`iter_lines`.
 
             kwargs:
-                Forwarded to :meth:`BaseRecord.serialize` of each record.
+                Forwarded to :meth:`BaseRecord.to_bytestr` of each record, or
+                to :meth:`iter_lines`.
 
         Returns:
             :class:`BaseFile`: *self*.
 
         See Also:
             :meth:`parse`
+            :meth:`iter_lines`
             :meth:`BaseRecord.serialize`
 
         Examples:
@@ -3662,8 +3806,12 @@ class BaseFile(abc.ABC):
             :00000001FF
         """
 
-        for record in self.records:
-            record.serialize(stream, *args, **kwargs)
+        records = self._records
+        if records is None:
+            lines = self.iter_lines(*args, **kwargs)
+        else:
+            lines = [record.to_bytestr(*args, **kwargs) for record in records]
+        stream.write(b''.join(lines))
         return self
 
     def shift(self, offset: int) -> Self:
@@ -3765,6 +3913,11 @@ class BaseFile(abc.ABC):
         The :attr:`records` is assigned upon return.
         Any exceptions being raised should not alter the file object.
 
+        Implementations copy each chunk yielded by
+        :meth:`bytesparse.base.ImmutableMemory.chop` within a
+        ``with chunk_view:`` block, so that the view over :attr:`memory` is
+        released right after its data is copied into the record.
+
         Returns:
             :class:`BaseFile`: *self*.
 
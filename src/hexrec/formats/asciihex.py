@@ -29,6 +29,7 @@ See Also:
     `<https://srecord.sourceforge.net/man/man5/srec_ascii_hex.5.html>`_
 """
 
+import binascii
 import enum
 import re
 from typing import IO
@@ -45,7 +46,6 @@ from ..base import BaseRecord
 from ..base import BaseTag
 from ..base import TypeAlias
 from ..utils import hexlify
-from ..utils import unhexlify
 
 try:
     from typing import Self
@@ -125,6 +125,8 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class AsciiHexRecord(BaseRecord):
     r"""ASCII-HEX record object."""
 
+    __slots__ = ()
+
     Tag: Type[AsciiHexTag] = AsciiHexTag
 
     LINE_REGEX = re.compile(
@@ -314,7 +316,7 @@ class AsciiHexRecord(BaseRecord):
         else:
             tag = Tag.DATA
             data = groups_data.translate(None, delete=cls.DATA_EXECHARS)
-            data = unhexlify(data)
+            data = binascii.unhexlify(data)
 
         record = cls(tag,
                      address=address,
@@ -469,7 +471,7 @@ class AsciiHexRecord(BaseRecord):
                 if tag == Tag.CHECKSUM:
                     raise ValueError('checksum required')
             else:
-                if not 0 <= self.checksum <= 0xFFFF:
+                if self.checksum > 0xFFFF:
                     raise ValueError('checksum overflow')
 
         if count:
@@ -608,8 +610,8 @@ class AsciiHexFile(BaseFile):
     ) -> 'BaseFile':
         r"""Serializes records onto a byte stream.
 
-        It executes :meth:`MosRecord.serialize` for each of the stored
-        :attr:`records`.
+        It joins the :meth:`AsciiHexRecord.to_bytestr` output of each of the stored
+        :attr:`records`, writing it with a single ``stream.write`` call.
 
         Args:
             stream (bytes IO):
@@ -652,9 +654,9 @@ class AsciiHexFile(BaseFile):
         if stxetx:
             stream.write(b'\x02')
 
-        for record in self.records:
-            record.serialize(stream, exechar=exechar, exelast=exelast,
-                             dollarend=dollarend, end=end)
+        stream.write(b''.join([record.to_bytestr(exechar=exechar, exelast=exelast,
+                                                 dollarend=dollarend, end=end)
+                               for record in self.records]))
 
         if stxetx:
             stream.write(b'\x03')
@@ -728,26 +730,22 @@ class AsciiHexFile(BaseFile):
         Record = self.Record
         last_data_endex = 0
         file_checksum = 0
-        chunk_views = []
-        try:
-            for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
-                chunk_views.append(chunk_view)
-                data = bytes(chunk_view)
-                if checksum:
-                    sum_data = sum(data) & 0xFFFF
-                    file_checksum = (file_checksum + sum_data) & 0xFFFF
+        append = records.append
+        create_data = Record.create_data
 
-                if chunk_start != last_data_endex:
-                    record = Record.create_address(chunk_start, addrlen=addrlen)
-                    records.append(record)
+        for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
+            with chunk_view:
+                data = bytes(chunk_view)
+            if checksum:
+                sum_data = sum(data) & 0xFFFF
+                file_checksum = (file_checksum + sum_data) & 0xFFFF
 
-                record = Record.create_data(chunk_start, data)
-                records.append(record)
-                last_data_endex = chunk_start + len(chunk_view)
+            if chunk_start != last_data_endex:
+                record = Record.create_address(chunk_start, addrlen=addrlen)
+                append(record)
 
-        finally:
-            for chunk_view in chunk_views:
-                chunk_view.release()
+            append(create_data(chunk_start, data))
+            last_data_endex = chunk_start + len(data)
 
         if checksum:
             record = Record.create_checksum(file_checksum)
@@ -29,6 +29,7 @@ See Also:
     `<https://srecord.sourceforge.net/man/man5/srec_atmel_generic.5.html>`_
 """
 
+import binascii
 import enum
 import re
 from typing import Any
@@ -44,8 +45,6 @@ from ..base import BaseFile
 from ..base import BaseRecord
 from ..base import BaseTag
 from ..base import TypeAlias
-from ..utils import hexlify
-from ..utils import unhexlify
 
 try:
     from typing import Self
@@ -75,6 +74,8 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class AvrRecord(BaseRecord):
     r"""Atmel Generic record object."""
 
+    __slots__ = ()
+
     Tag: Type[AvrTag] = AvrTag
 
     LINE_REGEX = re.compile(
@@ -143,7 +144,7 @@ class AvrRecord(BaseRecord):
         groups = match.groupdict()
         before = groups['before']
         address = int(groups['address'], 16)
-        data = unhexlify(groups['data'])
+        data = binascii.unhexlify(groups['data'])
         after = groups['after']
 
         record = cls(cls.Tag.DATA,
@@ -164,7 +165,7 @@ class AvrRecord(BaseRecord):
         line = b'%s%06X:%s%s%s' % (
             self.before,
             self.address & 0xFFFFFF,
-            hexlify(self.data),
+            binascii.hexlify(self.data).upper(),
             self.after,
             end,
         )
@@ -181,7 +182,7 @@ class AvrRecord(BaseRecord):
             'before': self.before,
             'address': b'%06X' % (self.address & 0xFFFFFF),
             'begin': b':',
-            'data': hexlify(self.data),
+            'data': binascii.hexlify(self.data).upper(),
             'after': self.after,
             'end': end,
         }
@@ -204,7 +205,7 @@ class AvrRecord(BaseRecord):
         if data_size != 2:
             raise ValueError('data size overflow')
 
-        if not 0 <= self.address <= 0xFFFFFF:
+        if self.address > 0xFFFFFF:
             raise ValueError('address overflow')
 
         return self
@@ -287,22 +288,17 @@ class AvrFile(BaseFile):
 
         records = []
         Record = self.Record
-        chunk_views = []
-        try:
-            for chunk_start, chunk_view in memory.chop(2):
+        append = records.append
+        create_data = Record.create_data
+
+        for chunk_start, chunk_view in memory.chop(2):
+            with chunk_view:
                 if chunk_start & 1:
                     raise ValueError('invalid word alignment')
                 if len(chunk_view) != 2:
                     raise ValueError('invalid word size')
-                word_address = chunk_start // 2
-                chunk_views.append(chunk_view)
                 word_data = bytes(chunk_view)
-                record = Record.create_data(word_address, word_data)
-                records.append(record)
-
-        finally:
-            for chunk_view in chunk_views:
-                chunk_view.release()
+            append(create_data(chunk_start >> 1, word_data))
 
         self.discard_records()
         self._records = records
@@ -29,9 +29,12 @@ See Also:
     `<https://en.wikipedia.org/wiki/Intel_HEX>`_
 """
 
+import binascii
 import enum
 import re
+from typing import IO
 from typing import Any
+from typing import Iterator
 from typing import Mapping
 from typing import Optional
 from typing import Sequence
@@ -46,8 +49,8 @@ from ..base import BaseFile
 from ..base import BaseRecord
 from ..base import BaseTag
 from ..base import TypeAlias
-from ..utils import hexlify
-from ..utils import unhexlify
+from ..utils import HEX_BYTE_TABLE
+from ..utils import unhexlify_line
 
 try:
     from typing import Self
@@ -128,7 +131,7 @@ class IhexTag(BaseTag, enum.IntEnum):
 
     def is_file_termination(self) -> bool:
 
-        return self.is_eof()
+        return self == self.END_OF_FILE
 
     def is_start(self) -> bool:
         r"""Tells whether this is a Start Address record tag.
@@ -154,6 +157,10 @@ class IhexTag(BaseTag, enum.IntEnum):
                 (self == self.START_LINEAR_ADDRESS))
 
 
+_TAG_BY_VALUE: Mapping[int, IhexTag] = {tag.value: tag for tag in IhexTag}
+r"""Intel HEX tags by value; valid only while :attr:`IhexRecord.Tag` is :class:`IhexTag`."""
+
+
 if not __TYPING_HAS_SELF:  # pragma: no cover
     del Self
     Self = TypeVar('Self', bound='IhexRecord')
@@ -162,6 +169,8 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class IhexRecord(BaseRecord):
     r"""Intel HEX record object."""
 
+    __slots__ = ('_extended_address',)
+
     Tag: Type[IhexTag] = IhexTag
 
     LINE_REGEX = re.compile(
@@ -169,7 +178,7 @@ class IhexRecord(BaseRecord):
         b'(?P<count>[0-9A-Fa-f]{2})'
         b'(?P<address>[0-9A-Fa-f]{4})'
         b'(?P<tag>[0-9A-Fa-f]{2})'
-        b'(?P<data>([0-9A-Fa-f]{2}){,255})'
+        b'(?P<data>(?:[0-9A-Fa-f]{2}){,255})'
         b'(?P<checksum>[0-9A-Fa-f]{2})'
         b'(?P<after>[^\\r\\n]*)\\r?\\n?$'
     )
@@ -177,16 +186,16 @@ class IhexRecord(BaseRecord):
 
     def compute_checksum(self) -> int:
 
-        if self.count is None:
+        count = self.count
+        if count is None:
             raise ValueError('missing count')
 
-        count = self.count & 0xFF
         address = self.address & 0xFFFF
-        sum_address = (address >> 8) + (address & 0xFF)
-        sum_data = sum(iter(self.data))
-        tag = _cast(IhexTag, self.tag) & 0xFF
-        checksum = (count + sum_address + tag + sum_data)
-        checksum = (0x100 - (checksum & 0xFF)) & 0xFF
+        checksum = ((count & 0xFF) +
+                    (address >> 8) + (address & 0xFF) +
+                    (_cast(IhexTag, self.tag) & 0xFF) +
+                    sum(self.data))
+        checksum = -checksum & 0xFF
         return checksum
 
     def compute_count(self) -> int:
@@ -208,7 +217,7 @@ class IhexRecord(BaseRecord):
         if size > 0xFF:
             raise ValueError('data size overflow')
 
-        record = cls(cls.Tag.DATA, address=address, data=data)
+        record = cls(cls.Tag.DATA, address=address, data=data, validate=False)
         return record
 
     @classmethod
@@ -339,18 +348,42 @@ class IhexRecord(BaseRecord):
         validate: bool = True,
     ) -> Self:
 
+        # Fast path for plain lines: hexadecimal digits between ':' and EOL
+        if line[:1] == b':':
+            raw = unhexlify_line(line, 1)
+            if 5 <= len(raw) <= 260:
+                Tag = cls.Tag
+                tag = _TAG_BY_VALUE.get(raw[3]) if Tag is IhexTag else None
+                if tag is None:
+                    tag = Tag(raw[3])  # raises
+                record = cls(tag,
+                             address=((raw[1] << 8) | raw[2]),
+                             data=raw[4:-1],
+                             count=raw[0],
+                             checksum=raw[-1],
+                             validate=False)
+                if validate:
+                    if sum(raw) & 0xFF:
+                        raise ValueError('wrong checksum')
+                    if raw[0] != len(raw) - 5:
+                        raise ValueError('wrong count')
+                    record.validate(checksum=False, count=False)
+                return record
+
         match = cls.LINE_REGEX.match(line)
         if not match:
             raise ValueError('syntax error')
 
-        groups = match.groupdict()
-        before = groups['before']
-        count = int(groups['count'], 16)
-        address = int(groups['address'], 16)
-        tag = cls.Tag(int(groups['tag'], 16))
-        data = unhexlify(groups['data'])
-        checksum = int(groups['checksum'], 16)
-        after = groups['after']
+        before, count, address, tag, data, checksum, after = match.groups()
+        count = int(count, 16)
+        address = int(address, 16)
+        tag_value = int(tag, 16)
+        Tag = cls.Tag
+        tag = _TAG_BY_VALUE.get(tag_value) if Tag is IhexTag else None
+        if tag is None:
+            tag = Tag(tag_value)  # raises
+        data = binascii.unhexlify(data) if data else b''
+        checksum = int(checksum, 16)
 
         record = cls(tag,
                      address=address,
@@ -371,7 +404,7 @@ class IhexRecord(BaseRecord):
             (self.count or 0) & 0xFF,
             self.address & 0xFFFF,
             _cast(IhexTag, self.tag) & 0xFF,
-            hexlify(self.data),
+            binascii.hexlify(self.data).upper(),
             (self.checksum or 0) & 0xFF,
             self.after,
             end,
@@ -384,11 +417,11 @@ class IhexRecord(BaseRecord):
         return {
             'before': self.before,
             'begin': b':',
-            'count': b'%02X' % ((self.count or 0) & 0xFF),
+            'count': HEX_BYTE_TABLE[(self.count or 0) & 0xFF],
             'address': b'%04X' % (self.address & 0xFFFF),
-            'tag': b'%02X' % (_cast(IhexTag, self.tag) & 0xFF),
-            'data': hexlify(self.data),
-            'checksum': b'%02X' % ((self.checksum or 0) & 0xFF),
+            'tag': HEX_BYTE_TABLE[_cast(IhexTag, self.tag) & 0xFF],
+            'data': binascii.hexlify(self.data).upper(),
+            'checksum': HEX_BYTE_TABLE[(self.checksum or 0) & 0xFF],
             'after': self.after,
             'end': end,
         }
@@ -407,19 +440,21 @@ class IhexRecord(BaseRecord):
         if b':' in self.before:
             raise ValueError('junk before contains ":"')
 
-        if self.checksum is not None:
-            if not 0 <= self.checksum <= 0xFF:
+        record_checksum = self.checksum
+        if record_checksum is not None:
+            if record_checksum > 0xFF:
                 raise ValueError('checksum overflow')
 
-        if self.count is not None:
-            if not 0 <= self.count <= 0xFF:
+        record_count = self.count
+        if record_count is not None:
+            if record_count > 0xFF:
                 raise ValueError('count overflow')
 
         data_size = len(self.data)
         if data_size > 0xFF:
             raise ValueError('data size overflow')
 
-        if not 0 <= self.address <= 0xFFFF:
+        if self.address > 0xFFFF:
             raise ValueError('address overflow')
 
         tag = _cast(IhexTag, self.tag)
@@ -493,12 +528,13 @@ class IhexFile(BaseFile):
         startaddr = None
         has_ela = False
         has_esa = False
+        chunks = []
 
         for record in self._records:
             tag = _cast(IhexTag, record.tag)
 
             if tag == data_tag:
-                memory.write(record.address + extension, record.data)
+                chunks.append((record.address + extension, record.data))
 
             elif tag == ela_tag:
                 has_ela = True
@@ -511,12 +547,103 @@ class IhexFile(BaseFile):
             elif tag.is_start():
                 startaddr = record.data_to_int()
 
+        for address, block_data in self._merge_data_blocks(chunks):
+            memory.write(address, block_data)
+
         self.discard_memory()
         self._memory = memory
         self._startaddr = startaddr
         self._linear = has_ela or not has_esa
         return self
 
+    def iter_lines(
+        self,
+        align: bool = False,
+        start: bool = True,
+        end: AnyBytes = b'\r\n',
+    ) -> Iterator[bytes]:
+        r"""Iterates serialized lines straight from memory.
+
+        It generates the same lines that :meth:`serialize` would write after
+        :meth:`update_records`, but *data* lines are built directly from the
+        :attr:`memory` chunks, without creating any record objects.
+
+        The :attr:`records` are left untouched.
+
+        Args:
+            align (bool):
+                Aligns data record chunk address bounds to :attr:`maxdatalen`.
+
+            start (bool):
+                Generates the *start address* line, if :attr:`startaddr` is
+                not ``None``.
+
+            end (bytes):
+                Line termination.
+
+        Yields:
+            bytes: Serialized line.
+
+        Raises:
+            ValueError: Data chunk overflow.
+
+        See Also:
+            :meth:`update_records`
+            :meth:`serialize`
+
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> blocks = [[123, b'abc']]
+            >>> file = IhexFile.from_blocks(blocks, maxdatalen=16, startaddr=456)
+            >>> for line in file.iter_lines(end=b''):
+            ...     print(line.decode())
+            :03007B006162635C
+            :04000005000001C82E
+            :00000001FF
+        """
+
+        memory = self.memory
+        Record = self.Record
+        hexlify = binascii.hexlify
+        bank_endex = 0x10000  # chunks come by ascending address
+        linear = self.linear
+
+        for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
+            # count, address, tag, data, checksum
+            size = len(chunk_view)
+            body = bytearray((size & 0xFF, (chunk_start >> 8) & 0xFF, chunk_start & 0xFF, 0))
+            with chunk_view:
+                body += chunk_view
+
+            if not linear and chunk_start > 0x000FFFFF:
+                raise ValueError('segment overflow')
+
+            if chunk_start >= bank_endex:
+                bank = chunk_start >> 16
+                bank_endex = (bank + 1) << 16
+                if linear:
+                    record = Record.create_extended_linear_address(bank)
+                else:
+                    record = Record.create_extended_segment_address(bank << 12)
+                yield record.to_bytestr(end=end)
+
+            if size > 0xFF:
+                raise ValueError('data size overflow')
+
+            body.append(-sum(body) & 0xFF)
+            yield b':%s%s' % (hexlify(body).upper(), end)
+
+        startaddr = self._startaddr
+        if start and startaddr is not None:
+            if linear:
+                record = Record.create_start_linear_address(startaddr)
+            else:
+                record = Record.create_start_segment_address(startaddr)
+            yield record.to_bytestr(end=end)
+
+        record = Record.create_end_of_file()
+        yield record.to_bytestr(end=end)
+
     @property
     def linear(self) -> bool:
         r"""bool: Linear addressing.
@@ -571,6 +698,43 @@ class IhexFile(BaseFile):
             self.discard_records()
         self._linear = linear
 
+    def serialize(self, stream: IO, end: AnyBytes = b'\r\n') -> Self:
+        r"""Serializes records onto a byte stream.
+
+        It joins the :meth:`IhexRecord.to_bytestr` output of each of the stored
+        :attr:`records`, writing it with a single ``stream.write`` call.
+
+        If :attr:`records` are not populated yet, lines are generated straight
+        from :attr:`memory` via :meth:`iter_lines` with the default options
+        of :meth:`update_records`, leaving :attr:`records` untouched.
+
+        Args:
+            stream (bytes IO):
+                Stream to serialize records onto.
+
+            end (bytes):
+                Line termination.
+
+        Returns:
+            :class:`IhexFile`: *self*.
+
+        See Also:
+            :meth:`parse`
+            :meth:`iter_lines`
+            :meth:`IhexRecord.serialize`
+
+        Examples:
+            >>> from hexrec import IhexFile
+            >>> file = IhexFile.from_blocks([[0xDA7A, b'abc']], startaddr=0xCAFE)
+            >>> import sys
+            >>> _ = file.serialize(sys.stdout.buffer, end=b'\n')
+            :03DA7A0061626383
+            :040000050000CAFE2F
+            :00000001FF
+        """
+
+        return super().serialize(stream, end=end)
+
     @property
     def startaddr(self) -> Optional[int]:
         r"""Start address.
@@ -680,48 +844,40 @@ class IhexFile(BaseFile):
 
         records = []
         Record = self.Record
-        last_start = 0
+        create_data = Record.create_data
+        bank_endex = 0x10000  # chunks come by ascending address
         linear = self.linear
-        chunk_views = []
-        try:
-            for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
-                chunk_views.append(chunk_view)
 
-                if linear:
-                    if (chunk_start ^ last_start) & 0xFFFF0000:
-                        extension = chunk_start >> 16
-                        record = Record.create_extended_linear_address(extension)
-                        records.append(record)
-                else:
-                    if chunk_start > 0x000FFFFF:
-                        raise ValueError('segment overflow')
-
-                    if (chunk_start ^ last_start) & 0x000F0000:
-                        extension = (chunk_start & 0x000F0000) >> 4
-                        record = Record.create_extended_segment_address(extension)
-                        records.append(record)
-
-                address = chunk_start & 0xFFFF
+        for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
+            with chunk_view:
                 data = bytes(chunk_view)
-                record = Record.create_data(address, data)
-                setattr(record, '_extended_address', chunk_start)  # for debug
-                records.append(record)
-                last_start = chunk_start
 
-            startaddr = self._startaddr
-            if start and startaddr is not None:
+            if not linear and chunk_start > 0x000FFFFF:
+                raise ValueError('segment overflow')
+
+            if chunk_start >= bank_endex:
+                bank = chunk_start >> 16
+                bank_endex = (bank + 1) << 16
                 if linear:
-                    record = Record.create_start_linear_address(startaddr)
+                    record = Record.create_extended_linear_address(bank)
                 else:
-                    record = Record.create_start_segment_address(startaddr)
+                    record = Record.create_extended_segment_address(bank << 12)
                 records.append(record)
 
-            record = Record.create_end_of_file()
+            record = create_data(chunk_start & 0xFFFF, data)
+            setattr(record, '_extended_address', chunk_start)  # for debug
+            records.append(record)
+
+        startaddr = self._startaddr
+        if start and startaddr is not None:
+            if linear:
+                record = Record.create_start_linear_address(startaddr)
+            else:
+                record = Record.create_start_segment_address(startaddr)
             records.append(record)
 
-        finally:
-            for chunk_view in chunk_views:
-                chunk_view.release()
+        record = Record.create_end_of_file()
+        records.append(record)
 
         self.discard_records()
         self._records = records
@@ -29,6 +29,7 @@ See Also:
     `<https://srecord.sourceforge.net/man/man5/srec_mos_tech.5.html>`_
 """
 
+import binascii
 import enum
 import io
 import re
@@ -44,8 +45,8 @@ from ..base import BaseFile
 from ..base import BaseRecord
 from ..base import BaseTag
 from ..base import TypeAlias
-from ..utils import hexlify
-from ..utils import unhexlify
+from ..utils import HEX_BYTE_TABLE
+from ..utils import unhexlify_line
 
 try:
     from typing import Self
@@ -91,7 +92,7 @@ class MosTag(BaseTag, enum.IntEnum):
 
     def is_file_termination(self) -> bool:
 
-        return self.is_eof()
+        return self == self.EOF
 
 
 if not __TYPING_HAS_SELF:  # pragma: no cover
@@ -102,13 +103,15 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class MosRecord(BaseRecord):
     r"""MOS Technology record object."""
 
+    __slots__ = ()
+
     Tag: Type[MosTag] = MosTag
 
     LINE_REGEX = re.compile(
         b'^\0*(?P<before>[^;]*);'
         b'(?P<count>[0-9A-Fa-f]{2})'
         b'(?P<address>[0-9A-Fa-f]{4})'
-        b'(?P<data>([0-9A-Fa-f]{2}){,255})'
+        b'(?P<data>(?:[0-9A-Fa-f]{2}){,255})'
         b'(?P<checksum>[0-9A-Fa-f]{4})'
         b'(?P<after>[^\\r\\n]*)\\r?\\n?\0*$'
     )
@@ -116,14 +119,15 @@ class MosRecord(BaseRecord):
 
     def compute_checksum(self) -> int:
 
-        if self.count is None:
+        count = self.count
+        if count is None:
             raise ValueError('missing count')
 
-        count = self.count & 0xFF
         address = self.address & 0xFFFF
-        sum_address = (address >> 8) + (address & 0xFF)
-        sum_data = sum(iter(self.data))
-        checksum = (count + sum_address + sum_data) & 0xFFFF
+        checksum = ((count & 0xFF) +
+                    (address >> 8) + (address & 0xFF) +
+                    sum(self.data))
+        checksum &= 0xFFFF
         return checksum
 
     def compute_count(self) -> int:
@@ -145,7 +149,7 @@ class MosRecord(BaseRecord):
         if size > 0xFF:
             raise ValueError('size overflow')
 
-        record = cls(cls.Tag.DATA, address=address, data=data)
+        record = cls(cls.Tag.DATA, address=address, data=data, validate=False)
         return record
 
     @classmethod
@@ -217,17 +221,34 @@ class MosRecord(BaseRecord):
             ValueError: syntax error
         """
 
+        # Fast path for plain lines: hexadecimal digits between ';' and EOL
+        if line[:1] == b';':
+            raw = unhexlify_line(line, 1)
+            if 5 <= len(raw) <= 260:
+                checksum = (raw[-2] << 8) | raw[-1]
+                record = cls(cls.Tag.EOF if eof else cls.Tag.DATA,
+                             address=((raw[1] << 8) | raw[2]),
+                             data=raw[3:-2],
+                             count=raw[0],
+                             checksum=checksum,
+                             validate=False)
+                if validate:
+                    if (sum(raw) - raw[-2] - raw[-1]) & 0xFFFF != checksum:
+                        raise ValueError('wrong checksum')
+                    if raw[0] != len(raw) - 5:
+                        raise ValueError('wrong count')
+                    record.validate(checksum=False, count=False)
+                return record
+
         match = cls.LINE_REGEX.match(line)
         if not match:
             raise ValueError('syntax error')
 
-        groups = match.groupdict()
-        before = groups['before']
-        count = int(groups['count'], 16)
-        address = int(groups['address'], 16)
-        data = unhexlify(groups['data'])
-        checksum = int(groups['checksum'], 16)
-        after = groups['after']
+        before, count, address, data, checksum, after = match.groups()
+        count = int(count, 16)
+        address = int(address, 16)
+        data = binascii.unhexlify(data) if data else b''
+        checksum = int(checksum, 16)
 
         record = cls(cls.Tag.EOF if eof else cls.Tag.DATA,
                      address=address,
@@ -252,7 +273,7 @@ class MosRecord(BaseRecord):
             self.before,
             (self.count or 0) & 0xFF,
             self.address & 0xFFFF,
-            hexlify(self.data),
+            binascii.hexlify(self.data).upper(),
             (self.checksum or 0) & 0xFFFF,
             self.after,
             end,
@@ -272,9 +293,9 @@ class MosRecord(BaseRecord):
         return {
             'before': self.before,
             'begin': b';',
-            'count': b'%02X' % ((self.count or 0) & 0xFF),
+            'count': HEX_BYTE_TABLE[(self.count or 0) & 0xFF],
             'address': b'%04X' % (self.address & 0xFFFF),
-            'data': hexlify(self.data),
+            'data': binascii.hexlify(self.data).upper(),
             'checksum': b'%04X' % ((self.checksum or 0) & 0xFFFF),
             'after': self.after,
             'end': end,
@@ -295,19 +316,21 @@ class MosRecord(BaseRecord):
         if b';' in self.before:
             raise ValueError('junk before contains ";"')
 
-        if self.checksum is not None:
-            if not 0 <= self.checksum <= 0xFFFF:
+        record_checksum = self.checksum
+        if record_checksum is not None:
+            if record_checksum > 0xFFFF:
                 raise ValueError('checksum overflow')
 
-        if self.count is not None:
-            if not 0 <= self.count <= 0xFF:
+        record_count = self.count
+        if record_count is not None:
+            if record_count > 0xFF:
                 raise ValueError('count overflow')
 
         data_size = len(self.data)
         if data_size > 0xFF:
             raise ValueError('data size overflow')
 
-        if not 0 <= self.address <= 0xFFFF:
+        if self.address > 0xFFFF:
             raise ValueError('address overflow')
 
         return self
@@ -427,8 +450,8 @@ class MosFile(BaseFile):
     ) -> 'BaseFile':
         r"""Serializes records onto a byte stream.
 
-        It executes :meth:`MosRecord.serialize` for each of the stored
-        :attr:`records`.
+        It joins the :meth:`MosRecord.to_bytestr` output of each of the stored
+        :attr:`records`, writing it with a single ``stream.write`` call.
 
         Args:
             stream (bytes IO):
@@ -461,8 +484,8 @@ class MosFile(BaseFile):
             ;0000010001
         """
 
-        for record in self.records:
-            record.serialize(stream, end=end, nuls=nuls)
+        stream.write(b''.join([record.to_bytestr(end=end, nuls=nuls)
+                               for record in self.records]))
 
         if xoff:
             stream.write(b'\x13')
@@ -522,20 +545,16 @@ class MosFile(BaseFile):
 
         records = []
         Record = self.Record
-        chunk_views = []
-        try:
-            for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
-                chunk_views.append(chunk_view)
-                data = bytes(chunk_view)
-                record = Record.create_data(chunk_start, data)
-                records.append(record)
+        append = records.append
+        create_data = Record.create_data
 
-            record = Record.create_eof(len(records))
-            records.append(record)
+        for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
+            with chunk_view:
+                data = bytes(chunk_view)
+            append(create_data(chunk_start, data))
 
-        finally:
-            for chunk_view in chunk_views:
-                chunk_view.release()
+        record = Record.create_eof(len(records))
+        records.append(record)
 
         self.discard_records()
         self._records = records
@@ -578,24 +597,27 @@ class MosFile(BaseFile):
         if records is None:
             raise ValueError('records required')
 
+        Tag = _cast(MosTag, self.Record.Tag)
+        data_tag = Tag.DATA
+        eof_tag = Tag.EOF
         eof_record = None
         last_data_endex = 0
+        expected_eof_index = len(records) - 1
 
         for index, record in enumerate(records):
             record.validate()
-            tag = _cast(MosTag, record.tag)
+            tag = record.tag
 
-            if data_ordering:
-                if tag == tag.DATA:
+            if tag == data_tag:
+                if data_ordering:
                     address = record.address
                     if address < last_data_endex:
                         raise ValueError('unordered data record')
                     last_data_endex = address + len(record.data)
 
-            if tag == tag.EOF:
+            elif tag == eof_tag:
                 eof_record = record
 
-                expected_eof_index = len(records) - 1
                 if index != expected_eof_index:
                     raise ValueError('end of file record not last')
 
@@ -75,6 +75,8 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class RawRecord(BaseRecord):
     r"""Raw binary record object."""
 
+    __slots__ = ()
+
     Tag: Type[RawTag] = RawTag
 
     @classmethod
@@ -297,17 +299,13 @@ class RawFile(BaseFile):
 
         records = []
         Record = self.Record
-        chunk_views = []
-        try:
-            for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
-                chunk_views.append(chunk_view)
-                data = bytes(chunk_view)
-                record = Record.create_data(chunk_start, data)
-                records.append(record)
+        append = records.append
+        create_data = Record.create_data
 
-        finally:
-            for chunk_view in chunk_views:
-                chunk_view.release()
+        for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
+            with chunk_view:
+                data = bytes(chunk_view)
+            append(create_data(chunk_start, data))
 
         self.discard_records()
         self._records = records
@@ -29,9 +29,12 @@ See Also:
     `<https://en.wikipedia.org/wiki/SREC_(file_format)>`_
 """
 
+import binascii
 import enum
 import re
+from typing import IO
 from typing import Any
+from typing import Iterator
 from typing import Mapping
 from typing import Optional
 from typing import Sequence
@@ -46,8 +49,8 @@ from ..base import BaseFile
 from ..base import BaseRecord
 from ..base import BaseTag
 from ..base import TypeAlias
-from ..utils import hexlify
-from ..utils import unhexlify
+from ..utils import HEX_BYTE_TABLE
+from ..utils import unhexlify_line
 
 try:
     from typing import Self
@@ -125,13 +128,9 @@ class SrecTag(BaseTag, enum.IntEnum):
             ValueError: count overflow
         """
 
-        if count < 0:
+        if not 0 <= count <= 0xFFFFFF:
             raise ValueError('count overflow')
-        if count <= 0xFFFF:
-            return cls.COUNT_16
-        if count <= 0xFFFFFF:
-            return cls.COUNT_24
-        raise ValueError('count overflow')
+        return _FIT_COUNT_TAG[count.bit_length()]
 
     @classmethod
     def fit_data_tag(cls, address_max: int) -> Self:
@@ -165,15 +164,9 @@ class SrecTag(BaseTag, enum.IntEnum):
             ValueError: address overflow
         """
 
-        if address_max < 0:
+        if not 0 <= address_max <= 0xFFFFFFFF:
             raise ValueError('address overflow')
-        if address_max <= 0xFFFF:
-            return cls.DATA_16
-        if address_max <= 0xFFFFFF:
-            return cls.DATA_24
-        if address_max <= 0xFFFFFFFF:
-            return cls.DATA_32
-        raise ValueError('address overflow')
+        return _FIT_DATA_TAG[address_max.bit_length()]
 
     @classmethod
     def fit_start_tag(cls, address: int) -> Self:
@@ -206,15 +199,9 @@ class SrecTag(BaseTag, enum.IntEnum):
             ValueError: address overflow
         """
 
-        if address < 0:
+        if not 0 <= address <= 0xFFFFFFFF:
             raise ValueError('address overflow')
-        if address <= 0xFFFF:
-            return cls.START_16
-        if address <= 0xFFFFFF:
-            return cls.START_24
-        if address <= 0xFFFFFFFF:
-            return cls.START_32
-        raise ValueError('address overflow')
+        return _FIT_START_TAG[address.bit_length()]
 
     def get_address_max(self) -> Optional[int]:
         r"""Calculates the maximum address.
@@ -238,9 +225,7 @@ class SrecTag(BaseTag, enum.IntEnum):
             0
         """
 
-        mask = self.get_address_size()
-        if mask:
-            mask = (1 << (mask << 3)) - 1
+        mask = _ADDRESS_MAX[self]
         return mask
 
     def get_address_size(self) -> Optional[int]:
@@ -265,8 +250,7 @@ class SrecTag(BaseTag, enum.IntEnum):
             0
         """
 
-        SIZES = (2, 2, 3, 4, 0, 2, 3, 4, 3, 2)
-        size = SIZES[self]
+        size = _ADDRESS_SIZE[self]
         return size
 
     def get_data_max(self) -> Optional[int]:
@@ -289,10 +273,7 @@ class SrecTag(BaseTag, enum.IntEnum):
             0
         """
 
-        SIZES = (2, 2, 3, 4, 0, 0, 0, 0, 0, 0)
-        size = SIZES[self]
-        if size:
-            size = 0xFE - size
+        size = _DATA_MAX[self]
         return size
 
     def get_tag_match(self) -> Optional['SrecTag']:
@@ -314,12 +295,8 @@ class SrecTag(BaseTag, enum.IntEnum):
             True
         """
 
-        MATCHES = (None, 9, 8, 7, None, None, None, 3, 2, 1)
-        match = MATCHES[self]
-        if match is None:
-            return None
-        tag_type = type(self)
-        return tag_type(match)
+        match = _TAG_MATCH[self]
+        return match
 
     def is_count(self) -> bool:
         r"""Tells whether this is a record count tag.
@@ -341,8 +318,7 @@ class SrecTag(BaseTag, enum.IntEnum):
             False
         """
 
-        return ((self == self.COUNT_16) or
-                (self == self.COUNT_24))
+        return _TAG_KIND[self] == _KIND_COUNT
 
     def is_data(self) -> bool:
         r"""Tells whether this is a data record tag.
@@ -363,9 +339,7 @@ class SrecTag(BaseTag, enum.IntEnum):
             False
         """
 
-        return ((self == self.DATA_16) or
-                (self == self.DATA_24) or
-                (self == self.DATA_32))
+        return _TAG_KIND[self] == _KIND_DATA
 
     def is_file_termination(self) -> bool:
 
@@ -411,9 +385,53 @@ class SrecTag(BaseTag, enum.IntEnum):
             False
         """
 
-        return ((self == self.START_16) or
-                (self == self.START_24) or
-                (self == self.START_32))
+        return _TAG_KIND[self] == _KIND_START
+
+
+_ADDRESS_SIZE: Sequence[int] = (2, 2, 3, 4, 0, 2, 3, 4, 3, 2)
+
+_ADDRESS_MAX: Sequence[int] = tuple(((1 << (size << 3)) - 1) for size in _ADDRESS_SIZE)
+
+_DATA_MAX: Sequence[int] = (0xFC, 0xFC, 0xFB, 0xFA, 0, 0, 0, 0, 0, 0)
+
+_TAG_MATCH: Sequence[Optional[SrecTag]] = tuple(
+    (None if match is None else SrecTag(match))
+    for match in (None, 9, 8, 7, None, None, None, 3, 2, 1)
+)
+
+_TAG_BY_DIGIT: Mapping[int, SrecTag] = {
+    (0x30 + tag): tag for tag in SrecTag if tag != SrecTag.RESERVED
+}
+
+_FIT_COUNT_TAG: Sequence[SrecTag] = (
+    (SrecTag.COUNT_16,) * 17 +
+    (SrecTag.COUNT_24,) * 8
+)
+
+_FIT_DATA_TAG: Sequence[SrecTag] = (
+    (SrecTag.DATA_16,) * 17 +
+    (SrecTag.DATA_24,) * 8 +
+    (SrecTag.DATA_32,) * 8
+)
+
+_FIT_START_TAG: Sequence[SrecTag] = (
+    (SrecTag.START_16,) * 17 +
+    (SrecTag.START_24,) * 8 +
+    (SrecTag.START_32,) * 8
+)
+
+_KIND_HEADER = 0
+_KIND_DATA = 1
+_KIND_COUNT = 2
+_KIND_START = 3
+
+_TAG_KIND: Sequence[int] = (
+    _KIND_HEADER,
+    _KIND_DATA, _KIND_DATA, _KIND_DATA,
+    _KIND_HEADER,  # reserved, rejected by record validation
+    _KIND_COUNT, _KIND_COUNT,
+    _KIND_START, _KIND_START, _KIND_START,
+)
 
 
 SIZE_TO_ADDRESS_FORMAT: Mapping[int, bytes] = {
@@ -423,6 +441,17 @@ SIZE_TO_ADDRESS_FORMAT: Mapping[int, bytes] = {
 }
 r"""Format byte string for each supported address size."""
 
+TAG_TO_LINE_FORMAT: Sequence[Optional[bytes]] = tuple(
+    (None if tag == SrecTag.RESERVED else
+     (b'%%sS%d%%02X' % tag) + SIZE_TO_ADDRESS_FORMAT[_ADDRESS_SIZE[tag]] + b'%s%02X%s%s')
+    for tag in SrecTag
+)
+r"""Whole line format byte string for each tag; ``None`` if not supported.
+
+Fields: *before*, *count*, *address*, *data* (hex), *checksum*, *after*,
+*end*.
+"""
+
 
 if not __TYPING_HAS_SELF:  # pragma: no cover
     del Self
@@ -432,6 +461,8 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class SrecRecord(BaseRecord):
     r"""Motorola S-record record object."""
 
+    __slots__ = ()
+
     Tag: Type[SrecTag] = SrecTag
 
     LINE1_REGEX = re.compile(
@@ -442,12 +473,12 @@ class SrecRecord(BaseRecord):
     r"""Line parser regex, part 1."""
 
     LINE2_REGEX = [re.compile(
-        b'^(?P<address>[0-9A-Fa-f]{%d})' % (4 + (i * 2))
+        b'(?P<address>[0-9A-Fa-f]{%d})' % (4 + (i * 2))
     ) for i in range(3)]
     r"""Line parser regex, part 2."""
 
     LINE3_REGEX = re.compile(
-        b'^(?P<data>([0-9A-Fa-f]{2})*)'
+        b'(?P<data>(?:[0-9A-Fa-f]{2})*)'
         b'(?P<checksum>[0-9A-Fa-f]{2})'
         b'(?P<after>[^\\r\\n]*)\\r?\\n?$'
     )
@@ -455,12 +486,11 @@ class SrecRecord(BaseRecord):
 
     def compute_checksum(self) -> int:
 
-        checksum = self.count & 0xFF
         address = self.address & 0xFFFFFFFF
-        while address > 0:
-            checksum += address & 0xFF
-            address >>= 8
-        checksum += sum(iter(self.data))
+        checksum = ((self.count & 0xFF) +
+                    (address >> 24) + ((address >> 16) & 0xFF) +
+                    ((address >> 8) & 0xFF) + (address & 0xFF) +
+                    sum(self.data))
         checksum = (checksum & 0xFF) ^ 0xFF
         return checksum
 
@@ -568,7 +598,7 @@ class SrecRecord(BaseRecord):
         if len(data) > tag.get_data_max():
             raise ValueError('data size overflow')
 
-        record = cls(tag, address=address, data=data)
+        record = cls(tag, address=address, data=data, validate=False)
         return record
 
     @classmethod
@@ -656,33 +686,44 @@ class SrecRecord(BaseRecord):
         validate: bool = True,
     ) -> Self:
 
+        # Fast path for plain lines: 'S', tag digit, hexadecimal digits, EOL
         Tag = cls.Tag
+        if len(line) > 2 and (line[0] | 0x20) == 0x73:  # 'S' or 's'
+            tag = _TAG_BY_DIGIT.get(line[1]) if Tag is SrecTag else None
+            if tag is not None:
+                raw = unhexlify_line(line, 2)
+                addrend = 1 + tag.get_address_size()
+                if len(raw) > addrend:
+                    record = cls(tag,
+                                 address=int.from_bytes(raw[1:addrend], 'big'),
+                                 data=raw[addrend:-1],
+                                 count=raw[0],
+                                 checksum=raw[-1],
+                                 validate=validate)
+                    return record
+
         line = memoryview(line)
 
+        # Parts 2 and 3 resume matching where the previous part ended
         match = cls.LINE1_REGEX.match(line)
         if not match:
             raise ValueError('syntax error')
-        groups = match.groupdict()
-        before = groups['before']
-        tag = Tag(int(groups['tag'], 16))
-        count = int(groups['count'], 16)
+        before, tag, count = match.groups()
+        tag = Tag(int(tag, 16))
+        count = int(count, 16)
 
         addridx = tag.get_address_size() - 2
-        line = line[match.span()[1]:]
-        match = cls.LINE2_REGEX[addridx].match(line)
+        match = cls.LINE2_REGEX[addridx].match(line, match.end())
         if not match:
             raise ValueError('syntax error')
-        groups = match.groupdict()
-        address = int(groups['address'], 16)
+        address = int(match.group(1), 16)
 
-        line = line[match.span()[1]:]
-        match = cls.LINE3_REGEX.match(line)
+        match = cls.LINE3_REGEX.match(line, match.end())
         if not match:
             raise ValueError('syntax error')
-        groups = match.groupdict()
-        data = unhexlify(groups['data'])
-        checksum = int(groups['checksum'], 16)
-        after = groups['after']
+        data, checksum, after = match.groups()
+        data = binascii.unhexlify(data)
+        checksum = int(checksum, 16)
 
         record = cls(tag,
                      address=address,
@@ -698,14 +739,13 @@ class SrecRecord(BaseRecord):
 
         self.validate(checksum=False, count=False)
         tag = _cast(SrecTag, self.tag)
-        addrfmt = SIZE_TO_ADDRESS_FORMAT[tag.get_address_size()]
+        linefmt = TAG_TO_LINE_FORMAT[tag]
 
-        bytestr = b'%sS%X%02X%s%s%02X%s%s' % (
+        bytestr = linefmt % (
             self.before,
-            tag & 0xF,
             (self.count or 0) & 0xFF,
-            addrfmt % (self.address & 0xFFFFFFFF),
-            hexlify(self.data),
+            self.address & 0xFFFFFFFF,
+            binascii.hexlify(self.data).upper(),
             (self.checksum or 0) & 0xFF,
             self.after,
             end,
@@ -722,10 +762,10 @@ class SrecRecord(BaseRecord):
             'before': self.before,
             'begin': b'S',
             'tag': b'%X' % (tag & 0xF),
-            'count': b'%02X' % ((self.count or 0) & 0xFF),
+            'count': HEX_BYTE_TABLE[(self.count or 0) & 0xFF],
             'address': addrfmt % (self.address & 0xFFFFFFFF),
-            'data': hexlify(self.data),
-            'checksum': b'%02X' % ((self.checksum or 0) & 0xFF),
+            'data': binascii.hexlify(self.data).upper(),
+            'checksum': HEX_BYTE_TABLE[(self.checksum or 0) & 0xFF],
             'after': self.after,
             'end': end,
         }
@@ -737,37 +777,38 @@ class SrecRecord(BaseRecord):
     ) -> Self:
 
         super().validate(checksum=checksum, count=count)
-        address = self.address
 
         # if self.after and not self.after.isspace():
         #     raise ValueError('junk after')
 
-        if self.before and not self.before.isspace():
+        before = self.before
+        if before and not before.isspace():
             raise ValueError('junk before')
 
-        if self.checksum is not None:
-            if not 0 <= self.checksum <= 0xFF:
+        record_checksum = self.checksum
+        if record_checksum is not None:
+            if record_checksum > 0xFF:
                 raise ValueError('checksum overflow')
 
-        if self.count is not None:
-            if not 3 <= self.count <= 0xFF:
+        record_count = self.count
+        if record_count is not None:
+            if not 3 <= record_count <= 0xFF:
                 raise ValueError('count overflow')
 
-        Tag = _cast(SrecTag, self.Tag)
         tag = _cast(SrecTag, self.tag)
-        if tag == Tag.RESERVED:
+        if tag == SrecTag.RESERVED:
             raise ValueError('reserved tag')
 
         data_size = len(self.data)
 
-        if not Tag.HEADER <= tag <= Tag.DATA_32:
+        if tag > SrecTag.DATA_32:
             if data_size:
                 raise ValueError('unexpected data')
 
-        if data_size > tag.get_data_max():
+        if data_size > _DATA_MAX[tag]:
             raise ValueError('data size overflow')
 
-        if not 0 <= address <= tag.get_address_max():
+        if self.address > _ADDRESS_MAX[tag]:
             raise ValueError('address overflow')
 
         return self
@@ -811,19 +852,24 @@ class SrecFile(BaseFile):
         memory = Memory()
         startaddr = 0
         header = None
+        tag_kind = _TAG_KIND
+        chunks = []
 
         for record in self._records:
-            tag = _cast(SrecTag, record.tag)
+            kind = tag_kind[record.tag]
 
-            if tag.is_data():
-                memory.write(record.address, record.data)
+            if kind == _KIND_DATA:
+                chunks.append((record.address, record.data))
 
-            elif tag.is_start():
+            elif kind == _KIND_START:
                 startaddr = record.address
 
-            elif tag.is_header():
+            elif record.tag == SrecTag.HEADER:
                 header = record.data
 
+        for address, block_data in self._merge_data_blocks(chunks):
+            memory.write(address, block_data)
+
         self.discard_memory()
         self._memory = memory
         self._startaddr = startaddr
@@ -884,6 +930,160 @@ class SrecFile(BaseFile):
             self.discard_records()
         self._header = header
 
+    def iter_lines(
+        self,
+        align: bool = False,
+        header: bool = True,
+        data: bool = False,
+        count: bool = True,
+        start: bool = True,
+        data_tag: Optional[SrecTag] = None,
+        count_tag: Optional[SrecTag] = None,
+        end: AnyBytes = b'\r\n',
+    ) -> Iterator[bytes]:
+        r"""Iterates serialized lines straight from memory.
+
+        It generates the same lines that :meth:`serialize` would write after
+        :meth:`update_records`, but *data* lines are built directly from the
+        :attr:`memory` chunks, without creating any record objects.
+
+        The :attr:`records` are left untouched.
+
+        Args:
+            align (bool):
+                Aligns data record chunk address bounds to :attr:`maxdatalen`.
+
+            header (bool):
+                Generates the *header* line if :attr:`header`.
+
+            data (bool):
+                Requires at least one *data* line be present, even if empty.
+
+            count (bool):
+                Generates the *count* line.
+
+            start (bool):
+                Generates the *start address* line.
+
+            data_tag (:class:`SrecTag`):
+                Specific *data* record tag to use.
+
+            count_tag (:class:`SrecTag`):
+                Specific *count* record tag to use.
+
+            end (bytes):
+                Line termination.
+
+        Yields:
+            bytes: Serialized line.
+
+        Raises:
+            ValueError: Data chunk overflow.
+
+        See Also:
+            :meth:`update_records`
+            :meth:`serialize`
+
+        Examples:
+            >>> from hexrec import SrecFile
+            >>> blocks = [[123, b'abc']]
+            >>> file = SrecFile.from_blocks(blocks, maxdatalen=16, startaddr=456)
+            >>> for line in file.iter_lines(end=b''):
+            ...     print(line.decode())
+            S0030000FC
+            S106007B61626358
+            S5030001FB
+            S90301C833
+        """
+
+        memory = self.memory
+        Record = self.Record
+        Tag = Record.Tag
+        hexlify = binascii.hexlify
+
+        if data_tag is None:
+            address_max = max(0, memory.endin) if memory else self.startaddr
+            data_tag = Tag.fit_data_tag(address_max)
+        elif not Tag.DATA_16 <= data_tag <= Tag.DATA_32:
+            raise ValueError('invalid data tag')
+
+        if header and self._header is not None:
+            yield Record.create_header(self._header).to_bytestr(end=end)
+
+        address_size = data_tag.get_address_size()
+        address_max = data_tag.get_address_max()
+        data_max = data_tag.get_data_max()
+        prefix = b'S%d' % data_tag
+        data_record_count = 0
+
+        for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
+            with chunk_view:
+                size = len(chunk_view)
+                if chunk_start > address_max:
+                    raise ValueError('address overflow')
+                if size > data_max:
+                    raise ValueError('data size overflow')
+
+                # count, address, data, checksum
+                body = bytearray((address_size + size + 1,))
+                body += chunk_start.to_bytes(address_size, 'big')
+                body += chunk_view
+
+            body.append((sum(body) & 0xFF) ^ 0xFF)
+            yield b'%s%s%s' % (prefix, hexlify(body).upper(), end)
+            data_record_count += 1
+
+        if data and not data_record_count:
+            yield Record.create_data(0, b'', tag=data_tag).to_bytestr(end=end)
+            data_record_count += 1
+
+        if count:
+            if count_tag is None:
+                count_tag = Tag.fit_count_tag(data_record_count)
+            yield Record.create_count(data_record_count, tag=count_tag).to_bytestr(end=end)
+
+        start_tag = data_tag.get_tag_match()
+        address = self._startaddr if start else 0
+        yield Record.create_start(address, tag=start_tag).to_bytestr(end=end)
+
+    def serialize(self, stream: IO, end: AnyBytes = b'\r\n') -> Self:
+        r"""Serializes records onto a byte stream.
+
+        It joins the :meth:`SrecRecord.to_bytestr` output of each of the stored
+        :attr:`records`, writing it with a single ``stream.write`` call.
+
+        If :attr:`records` are not populated yet, lines are generated straight
+        from :attr:`memory` via :meth:`iter_lines` with the default options
+        of :meth:`update_records`, leaving :attr:`records` untouched.
+
+        Args:
+            stream (bytes IO):
+                Stream to serialize records onto.
+
+            end (bytes):
+                Line termination.
+
+        Returns:
+            :class:`SrecFile`: *self*.
+
+        See Also:
+            :meth:`parse`
+            :meth:`iter_lines`
+            :meth:`SrecRecord.serialize`
+
+        Examples:
+            >>> from hexrec import SrecFile
+            >>> file = SrecFile.from_blocks([[0xDA7A, b'abc']], startaddr=0xCAFE)
+            >>> import sys
+            >>> _ = file.serialize(sys.stdout.buffer, end=b'\n')
+            S0030000FC
+            S106DA7A616263A3
+            S5030001FB
+            S903CAFE35
+        """
+
+        return super().serialize(stream, end=end)
+
     @property
     def startaddr(self) -> int:
         r"""Start address.
@@ -966,7 +1166,7 @@ class SrecFile(BaseFile):
             data_tag (:class:`SrecTag`):
                 Specific *data* record tag to use.
 
-            count_tag (:class:`SrecTag`git):
+            count_tag (:class:`SrecTag`):
                 Specific *count* record tag to use.
 
         Returns:
@@ -1009,39 +1209,37 @@ class SrecFile(BaseFile):
         if data_tag is None:
             address_max = max(0, memory.endin) if memory else self.startaddr
             data_tag = Tag.fit_data_tag(address_max)
-        chunk_views = []
-        data_record_count = 0
-        try:
-            if header and self._header is not None:
-                record = Record.create_header(self._header)
-                records.append(record)
 
-            for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
-                chunk_views.append(chunk_view)
+        if header and self._header is not None:
+            record = Record.create_header(self._header)
+            records.append(record)
+
+        append = records.append
+        create_data = Record.create_data
+        data_record_index = len(records)
+
+        for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
+            with chunk_view:
                 chunk_data = bytes(chunk_view)
-                record = Record.create_data(chunk_start, chunk_data, tag=data_tag)
-                records.append(record)
-                data_record_count += 1
-
-            if data and not data_record_count:
-                record = Record.create_data(0, b'', tag=data_tag)
-                records.append(record)
-                data_record_count += 1
-
-            if count:
-                if count_tag is None:
-                    count_tag = Tag.fit_count_tag(data_record_count)
-                record = Record.create_count(data_record_count, tag=count_tag)
-                records.append(record)
-
-            start_tag = data_tag.get_tag_match()
-            address = self._startaddr if start else 0
-            record = Record.create_start(address, tag=start_tag)
+            append(create_data(chunk_start, chunk_data, tag=data_tag))
+
+        data_record_count = len(records) - data_record_index
+
+        if data and not data_record_count:
+            record = Record.create_data(0, b'', tag=data_tag)
+            records.append(record)
+            data_record_count += 1
+
+        if count:
+            if count_tag is None:
+                count_tag = Tag.fit_count_tag(data_record_count)
+            record = Record.create_count(data_record_count, tag=count_tag)
             records.append(record)
 
-        finally:
-            for chunk_view in chunk_views:
-                chunk_view.release()
+        start_tag = data_tag.get_tag_match()
+        address = self._startaddr if start else 0
+        record = Record.create_start(address, tag=start_tag)
+        records.append(record)
 
         self.discard_records()
         self._records = records
@@ -1115,12 +1313,16 @@ class SrecFile(BaseFile):
         last_data_endex = 0
         data_tag_sample = None
         data_count = 0
+        count_index = len(records) - 2
+        start_index = count_index + 1
+        tag_kind = _TAG_KIND
 
         for index, record in enumerate(records):
             record.validate()
             tag = _cast(SrecTag, record.tag)
+            kind = tag_kind[tag]
 
-            if tag.is_data():
+            if kind == _KIND_DATA:
                 data_count += 1
 
                 if data_uniform:
@@ -1135,7 +1337,7 @@ class SrecFile(BaseFile):
                         raise ValueError('unordered data record')
                     last_data_endex = address + len(record.data)
 
-            elif tag.is_count():
+            elif kind == _KIND_COUNT:
                 if count_record is not None:
                     raise ValueError('multiple count records')
                 count_record = record
@@ -1144,16 +1346,16 @@ class SrecFile(BaseFile):
                     raise ValueError('wrong data record count')
 
                 if count_penultimate:
-                    if index != len(records) - 2:
+                    if index != count_index:
                         raise ValueError('count record not penultimate')
 
-            elif tag.is_start():
+            elif kind == _KIND_START:
                 if start_record is not None:
                     raise ValueError('multiple start records')
                 start_record = record
 
                 if start_last:
-                    if index != len(records) - 1:
+                    if index != start_index:
                         raise ValueError('start record not last')
 
             else:  # elif tag.is_header():
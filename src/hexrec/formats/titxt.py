@@ -29,6 +29,7 @@ See Also:
     `<https://downloads.ti.com/docs/esd/SPNU118/ti-txt-hex-format-ti-txt-option-stdz0795656.html>`_
 """
 
+import binascii
 import enum
 import re
 from typing import IO
@@ -46,7 +47,6 @@ from ..base import BaseRecord
 from ..base import BaseTag
 from ..base import TypeAlias
 from ..utils import hexlify
-from ..utils import unhexlify
 
 try:
     from typing import Self
@@ -115,7 +115,7 @@ class TiTxtTag(BaseTag, enum.IntEnum):
 
     def is_file_termination(self) -> bool:
 
-        return self.is_eof()
+        return self == self.EOF
 
 
 if not __TYPING_HAS_SELF:  # pragma: no cover
@@ -126,6 +126,8 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class TiTxtRecord(BaseRecord):
     r"""Texas Instruments TI-TXT record object."""
 
+    __slots__ = ()
+
     Tag: Type[TiTxtTag] = TiTxtTag
 
     LINE_REGEX = re.compile(
@@ -293,7 +295,7 @@ class TiTxtRecord(BaseRecord):
         else:
             tag = Tag.DATA
             data = groups_data.translate(None, delete=b' \t')
-            data = unhexlify(data)
+            data = binascii.unhexlify(data)
 
         record = cls(tag,
                      address=address,
@@ -518,23 +520,19 @@ class TiTxtFile(BaseFile):
         records = []
         Record = self.Record
         last_data_endex = 0
-        chunk_views = []
-        try:
-            for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
-                chunk_views.append(chunk_view)
-                data = bytes(chunk_view)
+        append = records.append
+        create_data = Record.create_data
 
-                if chunk_start != last_data_endex:
-                    record = Record.create_address(chunk_start, addrlen=addrlen)
-                    records.append(record)
+        for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
+            with chunk_view:
+                data = bytes(chunk_view)
 
-                record = Record.create_data(chunk_start, data)
-                records.append(record)
-                last_data_endex = chunk_start + len(chunk_view)
+            if chunk_start != last_data_endex:
+                record = Record.create_address(chunk_start, addrlen=addrlen)
+                append(record)
 
-        finally:
-            for chunk_view in chunk_views:
-                chunk_view.release()
+            append(create_data(chunk_start, data))
+            last_data_endex = chunk_start + len(data)
 
         record = Record.create_eof()
         records.append(record)
@@ -29,6 +29,7 @@ See Also:
     `<https://en.wikipedia.org/wiki/Tektronix_extended_HEX>`_
 """
 
+import binascii
 import enum
 import re
 from typing import Any
@@ -45,8 +46,7 @@ from ..base import BaseFile
 from ..base import BaseRecord
 from ..base import BaseTag
 from ..base import TypeAlias
-from ..utils import hexlify
-from ..utils import unhexlify
+from ..utils import HEX_BYTE_TABLE
 
 try:
     from typing import Self
@@ -92,7 +92,10 @@ class XtekTag(BaseTag, enum.IntEnum):
 
     def is_file_termination(self) -> bool:
 
-        return self.is_eof()
+        return self == self.EOF
+
+
+_NIBBLE_SUM_TABLE: bytes = bytes(((i >> 4) + (i & 0xF)) for i in range(256))
 
 
 if not __TYPING_HAS_SELF:  # pragma: no cover
@@ -103,6 +106,8 @@ if not __TYPING_HAS_SELF:  # pragma: no cover
 class XtekRecord(BaseRecord):
     r"""Tektronix Extended record object."""
 
+    __slots__ = ('addrlen',)
+
     Tag: Type[XtekTag] = XtekTag
 
     EQUALITY_KEYS: Sequence[str] = list(BaseRecord.EQUALITY_KEYS) + ['addrlen']
@@ -183,15 +188,14 @@ class XtekRecord(BaseRecord):
             raise ValueError('missing count')
         count_sum = (count >> 4) + (count & 0xF)
 
+        # Nibble sums of whole bytes via translation, summed in C
         address = self.address
         address_sum = 0
-        while address > 0:
-            address_sum += address & 0xF
-            address >>= 4
+        if address > 0:
+            address_bytes = address.to_bytes((address.bit_length() + 7) >> 3, 'big')
+            address_sum = sum(address_bytes.translate(_NIBBLE_SUM_TABLE))
 
-        data_sum = 0
-        for datum in self.data:
-            data_sum += (datum >> 4) + (datum & 0xF)
+        data_sum = sum(bytes(self.data).translate(_NIBBLE_SUM_TABLE))
 
         tag = _cast(XtekTag, self.tag)
         checksum = (count_sum + tag + self.addrlen + address_sum + data_sum) & 0xFF
@@ -283,7 +287,8 @@ class XtekRecord(BaseRecord):
         if len(data) > datamax:
             raise ValueError('data size overflow')
 
-        return cls(cls.Tag.DATA, address=address, data=data, addrlen=addrlen)
+        return cls(cls.Tag.DATA, address=address, data=data, addrlen=addrlen,
+                   validate=False)
 
     @classmethod
     def create_eof(
@@ -400,7 +405,7 @@ class XtekRecord(BaseRecord):
             raise ValueError('syntax error')
         groups = match.groupdict()
         address = int(groups['address'], 16)
-        data = unhexlify(groups['data'])
+        data = binascii.unhexlify(groups['data'])
         after = groups['after']
 
         record = cls(tag,
@@ -425,7 +430,7 @@ class XtekRecord(BaseRecord):
             (self.checksum or 0) & 0xFF,
             self.addrlen & 0xF,
             (b'%%0%dX' % self.addrlen) % (self.address & 0xFFFFFFFF),
-            hexlify(self.data),
+            binascii.hexlify(self.data).upper(),
             self.after,
             end,
         )
@@ -437,12 +442,12 @@ class XtekRecord(BaseRecord):
         return {
             'before': self.before,
             'begin': b'%',
-            'count': b'%02X' % ((self.count or 0) & 0xFF),
+            'count': HEX_BYTE_TABLE[(self.count or 0) & 0xFF],
             'tag': b'%X' % (_cast(XtekTag, self.tag) & 0xF),
-            'checksum': b'%02X' % ((self.checksum or 0) & 0xFF),
+            'checksum': HEX_BYTE_TABLE[(self.checksum or 0) & 0xFF],
             'addrlen': b'%X' % (self.addrlen & 0xF),
             'address': (b'%%0%dX' % self.addrlen) % (self.address & 0xFFFFFFFF),
-            'data': hexlify(self.data),
+            'data': binascii.hexlify(self.data).upper(),
             'after': self.after,
             'end': end,
         }
@@ -462,11 +467,11 @@ class XtekRecord(BaseRecord):
             raise ValueError('junk before contains "%"')
 
         if self.checksum is not None:
-            if not 0 <= self.checksum <= 0xFF:
+            if self.checksum > 0xFF:
                 raise ValueError('checksum overflow')
 
         if self.count is not None:
-            if not 0 <= self.count <= 0xFF:
+            if self.count > 0xFF:
                 raise ValueError('count overflow')
 
         addrlen = self.addrlen
@@ -474,7 +479,7 @@ class XtekRecord(BaseRecord):
             raise ValueError('invalid address length')
 
         addrmax = self.compute_address_max(addrlen)
-        if not 0 <= self.address <= addrmax:
+        if self.address > addrmax:
             raise ValueError('address overflow')
 
         datamax = (0xFA - addrlen) // 2
@@ -632,20 +637,16 @@ class XtekFile(BaseFile):
 
         records = []
         Record = self.Record
-        chunk_views = []
-        try:
-            for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
-                chunk_views.append(chunk_view)
-                data = bytes(chunk_view)
-                record = Record.create_data(chunk_start, data, addrlen=addrlen)
-                records.append(record)
+        append = records.append
+        create_data = Record.create_data
 
-            record = Record.create_eof(self.startaddr, addrlen=addrlen)
-            records.append(record)
+        for chunk_start, chunk_view in memory.chop(self.maxdatalen, align=align):
+            with chunk_view:
+                data = bytes(chunk_view)
+            append(create_data(chunk_start, data, addrlen=addrlen))
 
-        finally:
-            for chunk_view in chunk_views:
-                chunk_view.release()
+        record = Record.create_eof(self.startaddr, addrlen=addrlen)
+        records.append(record)
 
         self.discard_records()
         self._records = records
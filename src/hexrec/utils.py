@@ -89,6 +89,12 @@ Default values to delete from hexadecimal strings via :meth:`unhexlify`.
 These are commonly used as byte separators or whitespace in hex strings.
 """
 
+HEX_BYTE_TABLE: Sequence[bytes] = tuple(b'%02X' % i for i in range(256))
+r"""Byte value to uppercase hexadecimal string.
+
+Lookup table to format a single byte value without the formatting machinery.
+"""
+
 __BINASCII_HEXLIFY_HAS_SEP = (sys.version_info >= (3, 8))
 
 
@@ -298,6 +304,51 @@ def unhexlify(
     return bytestr
 
 
+def unhexlify_line(
+    line: AnyBytes,
+    start: int = 0,
+) -> bytes:
+    r"""Converts the hexadecimal body of a plain record line into raw bytes.
+
+    The hexadecimal body starts at offset `start` and lasts until the line
+    termination (``b'\n'``, ``b'\r\n'``, or none), which is trimmed away.
+
+    This is the fast path of record parsers for lines without any junk.
+    If the body is not made of hexadecimal digit pairs only, an empty byte
+    string is returned, so that the parser can fall back to its full syntax
+    check.
+
+    Args:
+        line (bytes):
+            Record line.
+
+        start (int):
+            Offset of the hexadecimal body within `line`.
+
+    Returns:
+        bytes: Raw byte string, empty if not a plain hexadecimal body.
+
+    Examples:
+        >>> from hexrec.utils import unhexlify_line
+        >>> unhexlify_line(b':00000001FF\r\n', 1)
+        b'\x00\x00\x00\x01\xff'
+        >>> unhexlify_line(b'S5030001FB\n', 2)
+        b'\x03\x00\x01\xfb'
+        >>> unhexlify_line(b' :00000001FF\r\n', 1)
+        b''
+    """
+
+    endex = len(line)
+    if endex and line[endex - 1] == 0x0A:  # '\n'
+        endex -= 1
+    if endex and line[endex - 1] == 0x0D:  # '\r'
+        endex -= 1
+    try:
+        return binascii.unhexlify(line[start:endex])
+    except binascii.Error:
+        return b''
+
+
 class SparseMemoryIO(MemoryIO):
     r"""Sparse memory I/O wrapper.
 